@@ -0,0 +1,2 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
@@ -0,0 +1,71 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Benchmark of CrateMover9000 moves with large crate counts: moving crates one at
+a time with pop()/append() against the single reversed-slice transfer used by
+CrateMover9000._move(). Run it from the repository root:
+
+python -m benchmarks.day_05_crate_moves
+"""
+
+from timeit import timeit
+from src.day_05.crate_mover import CrateMover9000
+
+STACK_HEIGHT = 200000
+CRATE_COUNT = 100000
+MOVES_COUNT = 50
+REPEAT_COUNT = 5
+
+
+################################################################################
+
+class OneAtATimeCrateMover9000(CrateMover9000):
+    """
+    CrateMover 9000 moving crates one at a time, as it did originally.
+    """
+
+################################################################################
+
+    def _move(self, crate_count: int, stack_from: int, stack_to: int) -> None:
+        """
+        :param crate_count: number of crates to move
+        :param stack_from: index of the stack to move the crates from
+        :param stack_to: index of the stack to move the crates to
+        """
+
+        for _ in range(crate_count):
+            crate = self._stacks[stack_from].pop()
+            self._stacks[stack_to].append(crate)
+
+################################################################################
+
+
+################################################################################
+
+def move_crates(crate_mover: CrateMover9000) -> None:
+    """
+    Moves CRATE_COUNT crates back and forth between two tall stacks.
+
+    :param crate_mover: crane to move the crates with
+    """
+
+    crate_mover._stacks = [["X"] * STACK_HEIGHT, ["Y"] * STACK_HEIGHT]
+    for i in range(MOVES_COUNT):
+        crate_mover._move(CRATE_COUNT, i % 2, 1 - i % 2)
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Prints the best time of each crane out of REPEAT_COUNT runs.
+    """
+
+    for crate_mover in (OneAtATimeCrateMover9000(), CrateMover9000()):
+        seconds = min(timeit(lambda: move_crates(crate_mover), number=1)
+                      for _ in range(REPEAT_COUNT))
+        print("{}: {} moves of {} crates in {:.3f} s".format(
+            type(crate_mover).__name__, MOVES_COUNT, CRATE_COUNT, seconds))
+
+################################################################################
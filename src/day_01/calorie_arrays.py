@@ -0,0 +1,168 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+import numpy as np
+from heapq import nlargest
+from itertools import chain
+from math import ceil
+from multiprocessing import Pool, cpu_count
+from os.path import getsize
+from typing import List, Tuple, Union
+from src.day_01.puzzle import INPUT_FILE_PATH
+
+# approximate size of the input file part processed by one worker at a time
+CHUNK_SIZE = 64 * 1024 * 1024
+
+
+################################################################################
+
+def inventory_totals_array(raw: bytes) -> np.ndarray:
+    """
+    Vectorized counterpart of calories() for huge calories lists. The whole
+    input is viewed as an array of bytes and parsed without any per-line Python
+    code: all meals are parsed at once digit by digit (Horner's scheme, one
+    array pass per decimal place of the longest meal) and the meals are then
+    summed to inventories with np.add.reduceat. Blank lines separate
+    inventories just like in calories(); leading and trailing blank lines are
+    ignored, and so are spaces, tabs and carriage returns.
+
+    :param raw: calories list as read from the input file in binary mode
+    :return: array of total calories carried by each Elf, in input order
+    """
+
+    data = np.frombuffer(raw.translate(None, b" \t\r").strip() + b"\n",
+                         dtype=np.uint8)
+    line_ends = np.flatnonzero(data == ord("\n"))
+    line_lengths = np.diff(line_ends, prepend=-1) - 1
+    is_meal = line_lengths > 0
+    meal_ends = line_ends[is_meal]
+    meal_lengths = line_lengths[is_meal]
+    if meal_ends.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # parse all meals at once, starting with the highest decimal place;
+    # shorter meals just get zero there
+    meals = np.zeros(meal_ends.size, dtype=np.int64)
+    for place in range(int(meal_lengths.max()), 0, -1):
+        has_place = meal_lengths >= place
+        digits = data[np.where(has_place, meal_ends - place, 0)] - ord("0")
+        # bytes below "0" wrap around in uint8, so they fail this check too
+        if (digits > 9).any():
+            raise ValueError("The calories list must contain only numbers")
+        meals *= 10
+        meals += np.where(has_place, digits, 0)
+
+    # every blank line starts a new inventory with the next meal; consecutive
+    # blank lines give the same start, so keep just one of them
+    inventory_starts = np.append(0, np.cumsum(is_meal)[~is_meal])
+    inventory_starts = inventory_starts[
+        np.diff(inventory_starts, append=-1) != 0]
+    return np.add.reduceat(meals, inventory_starts)
+
+
+################################################################################
+
+def top_calories_array(totals: np.ndarray, k: int) -> np.ndarray:
+    """
+    Selects the k biggest inventory totals with np.partition, which runs in
+    linear time instead of sorting all of the totals.
+
+    :param totals: total calories carried by each Elf
+    :param k: number of Elves carrying the most Calories to look for
+    :return: k biggest inventory totals, the biggest first
+    """
+
+    if k < 1:
+        raise ValueError("k must be a positive integer, got {}".format(k))
+
+    k = min(k, totals.size)
+    if k == 0:
+        return totals[:0]
+
+    return np.sort(np.partition(totals, -k)[-k:])[::-1]
+
+
+################################################################################
+
+def chunk_boundaries(chunks_count: int) -> List[int]:
+    """
+    Splits the input file into roughly equal parts that never cut an inventory
+    in two. Every boundary is moved forward from its ideal position to the
+    first byte after the nearest following blank line, so each part starts with
+    the first meal of an inventory. Parts may end up empty when the boundaries
+    pile up on a single huge inventory.
+
+    :param chunks_count: number of parts to split the input file into
+    :return: byte offsets of the parts; part i spans boundaries i and i + 1
+    """
+
+    size = getsize(INPUT_FILE_PATH)
+    boundaries = [0]
+    with open(INPUT_FILE_PATH, "rb") as f:
+        for i in range(1, chunks_count):
+            f.seek(max(size * i // chunks_count, boundaries[-1]))
+            # skip the rest of the (possibly cut) line the position fell into,
+            # then all the lines up to and including the next blank line
+            f.readline()
+            while True:
+                line = f.readline()
+                if not line or not line.strip():
+                    break
+            boundaries.append(f.tell())
+    boundaries.append(size)
+
+    return boundaries
+
+
+################################################################################
+
+def _chunk_top_calories(chunk: Tuple[str, int, int, int]) -> List[int]:
+    """
+    Worker for parallel_top_calories(). Reads one part of the input file and
+    finds its k biggest inventory totals.
+
+    :param chunk: input file path, start and end byte offsets of the part and k
+    :return: k biggest inventory totals of the part, the biggest first
+    """
+
+    file_path, start, end, k = chunk
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        totals = inventory_totals_array(f.read(end - start))
+
+    return top_calories_array(totals, k).tolist()
+
+
+################################################################################
+
+def parallel_top_calories(k: int,
+                          processes: Union[int, None] = None) -> List[int]:
+    """
+    Multi-process variant of top_calories() for calories lists of many
+    gigabytes. The input file is split at blank lines (see chunk_boundaries())
+    so that no inventory spans two parts, every part is parsed by a worker
+    process which sends back just its k biggest totals and those are merged to
+    the overall k biggest totals.
+
+    :param k: number of Elves carrying the most Calories to look for
+    :param processes: number of worker processes; all CPUs by default
+    :return: k biggest inventory totals, the biggest first
+    """
+
+    if k < 1:
+        raise ValueError("k must be a positive integer, got {}".format(k))
+
+    processes = processes or cpu_count()
+    chunks_count = max(processes,
+                       ceil(getsize(INPUT_FILE_PATH) / CHUNK_SIZE))
+    boundaries = chunk_boundaries(chunks_count)
+    chunks = ((INPUT_FILE_PATH, start, end, k)
+              for start, end in zip(boundaries, boundaries[1:])
+              if start < end)
+
+    with Pool(processes) as pool:
+        return nlargest(k, chain.from_iterable(
+            pool.imap_unordered(_chunk_top_calories, chunks)))
+
+
+################################################################################
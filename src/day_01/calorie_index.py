@@ -0,0 +1,157 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+import numpy as np
+from bisect import bisect_left
+from operator import neg
+from os import stat
+from os.path import exists
+from typing import Tuple
+from src.day_01.calorie_arrays import inventory_totals_array
+
+
+################################################################################
+
+class CalorieIndex(object):
+    """
+    Sorted index of total calories carried by each Elf. Elves are identified by
+    their index in the calories list (the same order as calories() returns the
+    inventories in). The index is built from the input file once and saved next
+    to it; it is rebuilt automatically when the input file changes. Queries then
+    never touch the input file: the k Elves carrying the most Calories are a
+    slice of the sorted totals, the rank of an Elf is a lookup and the Elves
+    above a threshold are found by a binary search.
+    """
+
+    INPUT_FILE_PATH = "src/day_01/input.txt"
+    INDEX_FILE_PATH = "src/day_01/calorie_index.npz"
+
+################################################################################
+
+    def __init__(self):
+        """
+        Load the saved index if it was built from the current input file,
+        build it and save it otherwise. If the index can't be saved (e.g. on a
+        read-only checkout), it is just kept in memory.
+        """
+
+        # size and modification time of the input file the index belongs to
+        source = np.array(self._input_file_signature(), dtype=np.int64)
+
+        if exists(self.INDEX_FILE_PATH):
+            with np.load(self.INDEX_FILE_PATH) as index:
+                if np.array_equal(index["source"], source):
+                    self._totals = index["totals"]
+                    self._elves = index["elves"]
+                    self._ranks = index["ranks"]
+                    return
+
+        self._build()
+        try:
+            np.savez(self.INDEX_FILE_PATH, source=source, totals=self._totals,
+                     elves=self._elves, ranks=self._ranks)
+        except OSError:
+            pass
+
+################################################################################
+
+    def _input_file_signature(self) -> Tuple[int, int]:
+        """
+        :return: size and modification time (in nanoseconds) of the input file
+        """
+
+        status = stat(self.INPUT_FILE_PATH)
+        return status.st_size, status.st_mtime_ns
+
+################################################################################
+
+    def _build(self) -> None:
+        """
+        Sort inventory totals in descending order; Elves carrying the same
+        amount of Calories keep their order from the calories list. Also keep
+        the position of every Elf in the sorted order (its rank).
+        """
+
+        with open(self.INPUT_FILE_PATH, "rb") as f:
+            totals = inventory_totals_array(f.read())
+
+        elves = np.arange(totals.size)
+        # lexsort sorts by the last key first
+        self._elves = np.lexsort((elves, -totals))
+        self._totals = totals[self._elves]
+        self._ranks = np.empty_like(self._elves)
+        self._ranks[self._elves] = elves
+
+################################################################################
+
+    @property
+    def elves_count(self) -> int:
+        """
+        :return: number of Elves in the calories list
+        """
+
+        return self._totals.size
+
+################################################################################
+
+    def _check_elf(self, elf: int) -> None:
+        """
+        Elf indexes are not wrapped around like Python sequence indexes.
+
+        :param elf: index of the Elf in the calories list
+        """
+
+        if not 0 <= elf < self.elves_count:
+            raise IndexError("Elf index {} out of range 0-{}".format(
+                elf, self.elves_count - 1))
+
+################################################################################
+
+    def total(self, elf: int) -> int:
+        """
+        :param elf: index of the Elf in the calories list
+        :return: total calories carried by the Elf
+        """
+
+        self._check_elf(elf)
+        return int(self._totals[self._ranks[elf]])
+
+################################################################################
+
+    def rank(self, elf: int) -> int:
+        """
+        :param elf: index of the Elf in the calories list
+        :return: rank of the Elf; the Elf carrying the most Calories is first
+        """
+
+        self._check_elf(elf)
+        return int(self._ranks[elf]) + 1
+
+################################################################################
+
+    def top(self, k: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        :param k: number of Elves carrying the most Calories to look for
+        :return: (Elf index, total calories) of the k Elves carrying the most
+        Calories, the biggest total first
+        """
+
+        if k < 1:
+            raise ValueError("k must be a positive integer, got {}".format(k))
+
+        return tuple(zip(self._elves[:k].tolist(), self._totals[:k].tolist()))
+
+################################################################################
+
+    def above(self, threshold: int) -> Tuple[int, ...]:
+        """
+        :param threshold: amount of Calories
+        :return: indexes of the Elves carrying more Calories than the
+        threshold, the biggest total first
+        """
+
+        # totals are in descending order, so search them negated
+        count = bisect_left(self._totals, -threshold, key=neg)
+        return tuple(self._elves[:count].tolist())
+
+################################################################################
@@ -11,10 +11,12 @@ consideration is food - in particular, the number of Calories each Elf is
 carrying (your puzzle input).
 """
 
-from typing import Tuple
+from heapq import heappush, heappushpop
+from typing import BinaryIO, Iterator, List, Tuple
 from src.utils.utils import print_puzzle_solution
 
 INPUT_FILE_PATH = "src/day_01/input.txt"
+TOP_ELVES_COUNT = 3
 
 
 ################################################################################
@@ -63,6 +65,62 @@ def calories() -> Tuple[Tuple[int]]:
                      for inventory in f.read().strip().split("\n\n"))
 
 
+################################################################################
+
+def inventory_totals(stream: BinaryIO) -> Iterator[int]:
+    """
+    Streams the calories list line by line and yields total calories of each
+    inventory as soon as its closing blank line (or the end of the stream) is
+    reached. Only the running total of the current inventory is kept in memory,
+    no matter how many Elves there are.
+
+    :param stream: calories list opened in binary mode
+    :return: iterator that yields total calories carried by each Elf
+    """
+
+    total = 0
+    has_meals = False
+    for line in stream:
+        line = line.strip()
+        if line:
+            total += int(line)
+            has_meals = True
+        elif has_meals:
+            yield total
+            total = 0
+            has_meals = False
+
+    if has_meals:
+        yield total
+
+
+################################################################################
+
+def top_calories(stream: BinaryIO, k: int) -> List[int]:
+    """
+    Keeps a bounded min-heap of the k biggest inventory totals seen so far; the
+    smallest of them sits on top of the heap and gets replaced whenever a bigger
+    total comes along. That makes the whole pass O(n log k) in time and O(k) in
+    memory.
+
+    :param stream: calories list opened in binary mode
+    :param k: number of Elves carrying the most Calories to look for
+    :return: k biggest inventory totals, the biggest first
+    """
+
+    if k < 1:
+        raise ValueError("k must be a positive integer, got {}".format(k))
+
+    heap = []
+    for total in inventory_totals(stream):
+        if len(heap) < k:
+            heappush(heap, total)
+        elif total > heap[0]:
+            heappushpop(heap, total)
+
+    return sorted(heap, reverse=True)
+
+
 ################################################################################
 
 def puzzle_01() -> None:
@@ -78,7 +136,8 @@ def puzzle_01() -> None:
     :return: None; Answer should be 70764.
     """
 
-    print_puzzle_solution(max(sum(inventory) for inventory in calories()))
+    with open(INPUT_FILE_PATH, "rb") as f:
+        print_puzzle_solution(top_calories(f, 1)[0])
 
 
 ################################################################################
@@ -105,7 +164,7 @@ def puzzle_02() -> None:
     :return: None; Answer should be 203905.
     """
 
-    print_puzzle_solution(sum(
-        sorted(sum(inventory) for inventory in calories())[-3:]))
+    with open(INPUT_FILE_PATH, "rb") as f:
+        print_puzzle_solution(sum(top_calories(f, TOP_ELVES_COUNT)))
 
 ################################################################################
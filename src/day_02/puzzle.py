@@ -9,7 +9,9 @@ closest to the snack storage, a giant Rock Paper Scissors tournament is already
 in progress.
 """
 
-from typing import Tuple
+from functools import cache
+from itertools import permutations
+from typing import Dict, Tuple
 from src.utils.utils import print_puzzle_solution
 
 INPUT_FILE_PATH = "src/day_02/input.txt"
@@ -65,6 +67,26 @@ SCORES_2 = {
     }
 }
 
+# all nine distinct lines a strategy guide can be made of
+OPPONENT_COLUMN = "ABC"
+PLAYER_COLUMN = "XYZ"
+ROUND_PATTERNS = tuple((opponent, player)
+                       for opponent in OPPONENT_COLUMN
+                       for player in PLAYER_COLUMN)
+
+# possible meanings of the player column; shapes in the order the opponent
+# column lists them (each shape beats the one before it) and round outcomes
+SHAPES = {
+    "rock": ROCK,
+    "paper": PAPER,
+    "scissors": SCISSORS
+}
+OUTCOMES = {
+    "loss": LOSS,
+    "draw": DRAW,
+    "win": WIN
+}
+
 
 ################################################################################
 
@@ -78,6 +100,133 @@ def game_rounds() -> Tuple[Tuple[str, str], ...]:
         return tuple((line[0], line[1]) for line in lines)
 
 
+################################################################################
+
+def rounds_histogram() -> Dict[Tuple[str, str], int]:
+    """
+    There are only nine distinct rounds, so instead of splitting the strategy
+    guide to rounds, just count how many times each of them occurs in it. Every
+    round is a distinct 3-byte pattern (e.g. "A Y") and patterns of different
+    lines can't overlap, so counting is done directly over the raw bytes.
+
+    :return: number of occurrences of each round in the strategy guide; keys are
+    the same tuples as in game_rounds()
+    """
+
+    with open(INPUT_FILE_PATH, "rb") as f:
+        raw = f.read()
+        return {pattern: raw.count(" ".join(pattern).encode())
+                for pattern in ROUND_PATTERNS}
+
+
+################################################################################
+
+def total_score(histogram: Dict[Tuple[str, str], int],
+                scores: Dict[str, Dict[str, int]]) -> int:
+    """
+    :param histogram: number of occurrences of each round
+    :param scores: score of each round (SCORES_1 or SCORES_2)
+    :return: total score; the dot product of round counts and round scores
+    """
+
+    return sum(count * scores[opponent][player]
+               for (opponent, player), count in histogram.items())
+
+
+################################################################################
+
+@cache
+def total_scores() -> Tuple[int, int]:
+    """
+    Builds the rounds histogram and scores it with both score tables; the
+    strategy guide is read only on the first call.
+
+    :return: total scores for puzzle 1 and puzzle 2
+    """
+
+    histogram = rounds_histogram()
+    return total_score(histogram, SCORES_1), total_score(histogram, SCORES_2)
+
+
+################################################################################
+
+def shape_scores(shapes: Tuple[str, str, str]) -> Dict[str, Dict[str, int]]:
+    """
+    Builds a score table (like SCORES_1) for a strategy guide whose player
+    column means shapes to choose.
+
+    :param shapes: shapes meant by X, Y and Z (keys of SHAPES)
+    :return: score of each round
+    """
+
+    shape_names = tuple(SHAPES)
+    # outcome by how many shapes the player's one is ahead of the opponent's
+    outcomes = (DRAW, WIN, LOSS)
+
+    return {opponent: {player: SHAPES[shape] + outcomes[
+        (shape_names.index(shape) - OPPONENT_COLUMN.index(opponent)) % 3]
+                       for player, shape in zip(PLAYER_COLUMN, shapes)}
+            for opponent in OPPONENT_COLUMN}
+
+
+################################################################################
+
+def outcome_scores(outcomes: Tuple[str, str, str]) -> Dict[str, Dict[str, int]]:
+    """
+    Builds a score table (like SCORES_2) for a strategy guide whose player
+    column means how the round needs to end.
+
+    :param outcomes: outcomes meant by X, Y and Z (keys of OUTCOMES)
+    :return: score of each round
+    """
+
+    shape_values = tuple(SHAPES.values())
+    # how many shapes the player's one has to be ahead of the opponent's
+    shifts = {"loss": 2, "draw": 0, "win": 1}
+
+    return {opponent: {player: OUTCOMES[outcome] + shape_values[
+        (OPPONENT_COLUMN.index(opponent) + shifts[outcome]) % 3]
+                       for player, outcome in zip(PLAYER_COLUMN, outcomes)}
+            for opponent in OPPONENT_COLUMN}
+
+
+################################################################################
+
+def strategy_scores(histogram: Dict[Tuple[str, str], int]) \
+        -> Dict[Tuple[str, str, str], int]:
+    """
+    Scores the strategy guide under every possible meaning of the player
+    column: all 3! ways X, Y and Z can stand for shapes and all 3! ways they can
+    stand for outcomes. Every strategy costs just a dot product over the nine
+    round counts, no matter how many rounds the strategy guide has.
+
+    :param histogram: number of occurrences of each round
+    :return: total score for each strategy; keys are the meanings of X, Y and Z
+    """
+
+    strategies = {shapes: shape_scores(shapes)
+                  for shapes in permutations(SHAPES)}
+    strategies.update({outcomes: outcome_scores(outcomes)
+                       for outcomes in permutations(OUTCOMES)})
+
+    return {meanings: total_score(histogram, scores)
+            for meanings, scores in strategies.items()}
+
+
+################################################################################
+
+def best_strategy(histogram: Dict[Tuple[str, str], int]) \
+        -> Tuple[Tuple[str, str, str], int]:
+    """
+    :param histogram: number of occurrences of each round
+    :return: meanings of X, Y and Z giving the highest total score and the
+    score itself
+    """
+
+    return max(strategy_scores(histogram).items(),
+               key=lambda strategy: strategy[1])
+
+
 ################################################################################
 
 def puzzle_01() -> None:
@@ -134,8 +283,7 @@ def puzzle_01() -> None:
     :return: None; Answer should be 13682.
     """
 
-    print_puzzle_solution(sum(SCORES_1[game_round[0]][game_round[1]]
-                              for game_round in game_rounds()))
+    print_puzzle_solution(total_scores()[0])
 
 
 ################################################################################
@@ -168,7 +316,6 @@ def puzzle_02() -> None:
     :return: None; Answer should be 12881.
     """
 
-    print_puzzle_solution(sum(SCORES_2[game_round[0]][game_round[1]]
-                              for game_round in game_rounds()))
+    print_puzzle_solution(total_scores()[1])
 
 ################################################################################
@@ -0,0 +1,73 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+import numpy as np
+from typing import Tuple
+from src.day_03.puzzle import GROUP_SIZE, INPUT_FILE_PATH, PRIORITY_TABLE
+
+# priorities go from 1 to 52; column 0 of presence matrices stays empty
+ITEM_TYPES_COUNT = 52
+PRIORITY_WEIGHTS = np.arange(ITEM_TYPES_COUNT + 1)
+PRIORITY_LOOKUP = np.frombuffer(PRIORITY_TABLE, dtype=np.uint8)
+
+
+################################################################################
+
+def presence_matrices() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Loads all rucksacks at once to a pair of boolean presence matrices, one for
+    each compartment. Row i of a matrix tells which item types are in that
+    compartment of rucksack i; the column index is the item type priority. The
+    whole input is processed with array operations, there is no per-rucksack
+    Python code.
+
+    :return: presence matrices of the first and the second compartments
+    """
+
+    with open(INPUT_FILE_PATH, "rb") as f:
+        data = np.frombuffer(f.read().strip() + b"\n", dtype=np.uint8)
+
+    is_newline = data == ord("\n")
+    line_ends = np.flatnonzero(is_newline)
+    line_lengths = np.diff(line_ends, prepend=-1) - 1
+    items = data[~is_newline]
+    # rucksack index and position within the rucksack of every item
+    rucksacks = np.repeat(np.arange(line_ends.size), line_lengths)
+    positions = np.flatnonzero(~is_newline) \
+        - np.repeat(line_ends - line_lengths, line_lengths)
+    item_priorities = PRIORITY_LOOKUP[items]
+    in_first = positions < np.repeat(line_lengths // 2, line_lengths)
+
+    first = np.zeros((line_ends.size, ITEM_TYPES_COUNT + 1), dtype=bool)
+    second = np.zeros_like(first)
+    first[rucksacks[in_first], item_priorities[in_first]] = True
+    second[rucksacks[~in_first], item_priorities[~in_first]] = True
+
+    return first, second
+
+
+################################################################################
+
+def presence_priorities_sums(first: np.ndarray,
+                             second: np.ndarray) -> Tuple[int, int]:
+    """
+    Solves both puzzles on presence matrices. Item types in both compartments
+    are an elementwise AND of the matrices; badges are item types present in
+    all three rucksacks of a group, so the rucksacks (both compartments
+    together) are reshaped to groups of three rows and ANDed along the group.
+    Each row then has exactly one item type left, so the sum of priorities is
+    a single matrix-vector product with the priorities.
+
+    :param first: presence matrix of the first compartments
+    :param second: presence matrix of the second compartments
+    :return: sums of priorities for puzzle 1 and puzzle 2
+    """
+
+    shared = first & second
+    badges = (first | second).reshape(
+        -1, GROUP_SIZE, first.shape[1]).all(axis=1)
+
+    return (int((shared @ PRIORITY_WEIGHTS).sum()),
+            int((badges @ PRIORITY_WEIGHTS).sum()))
+
+################################################################################
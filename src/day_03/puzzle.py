@@ -11,31 +11,39 @@ the jungle journey. Unfortunately, that Elf didn't quite follow the packing
 instructions, and so a few items now need to be rearranged.
 """
 
-from more_itertools import grouper
 from typing import Iterator, Tuple, List
 from src.utils.utils import print_puzzle_solution
 
 INPUT_FILE_PATH = "src/day_03/input.txt"
+GROUP_SIZE = 3
+# priority of every byte value; lowercase item types a through z have
+# priorities 1 through 26, uppercase item types A through Z have priorities 27
+# through 52 and anything else is not an item type (priority 0)
+PRIORITY_TABLE = bytes(
+    byte - ord("a") + 1 if ord("a") <= byte <= ord("z")
+    else byte - ord("A") + 27 if ord("A") <= byte <= ord("Z")
+    else 0
+    for byte in range(256))
 
 
 ################################################################################
 
-def load_rucksacks() -> List[str, ...]:
+def load_rucksacks() -> List[bytes, ...]:
     """
     The Elves have made a list of all of the items currently in each rucksack.
     The list of items for each rucksack is given as characters all on a single
     line.
 
-    :return: list of all of the items currently in each rucksack
+    :return: list of all of the items currently in each rucksack (as bytes)
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
+    with open(INPUT_FILE_PATH, "rb") as f:
         return f.read().strip().split()
 
 
 ################################################################################
 
-def load_compartments() -> Iterator[Tuple[str, str]]:
+def load_compartments() -> Iterator[Tuple[bytes, bytes]]:
     """
     Each rucksack has two large compartments. Every item type is identified by a
     single lowercase or uppercase letter (that is, a and A refer to different
@@ -55,20 +63,36 @@ def load_compartments() -> Iterator[Tuple[str, str]]:
 
 ################################################################################
 
-def load_groups() -> Iterator[Tuple[str | None, ...]]:
+def load_groups() -> Iterator[Tuple[bytes, ...]]:
     """
     For safety, the Elves are divided into groups of three. Every set of three
     lines in the rucksacks list corresponds to a single group.
 
+    The rucksacks list is streamed from the input file, so only the group being
+    read is kept in memory.
+
     :return: iterator that yields a tuple - rucksacks in each group
     """
 
-    return grouper(load_rucksacks(), 3)
+    with open(INPUT_FILE_PATH, "rb") as f:
+        group = []
+        for line in f:
+            rucksack = line.strip()
+            if rucksack:
+                group.append(rucksack)
+                if len(group) == GROUP_SIZE:
+                    yield tuple(group)
+                    group = []
+
+        if group:
+            raise ValueError(
+                "Number of rucksacks is not a multiple of {}; {} left over"
+                .format(GROUP_SIZE, len(group)))
 
 
 ################################################################################
 
-def priority(letter: str) -> int:
+def priority(item: int) -> int:
     """
     To help prioritize item rearrangement, every item type can be converted to a
     priority:
@@ -76,16 +100,25 @@ def priority(letter: str) -> int:
     -Lowercase item types a through z have priorities 1 through 26.
     -Uppercase item types A through Z have priorities 27 through 52.
 
-    :param letter: item type
-    :return: priority of the given item type
+    :param item: item type (byte value)
+    :return: priority of the given item type; 0 if it is not an item type
+    """
+
+    return PRIORITY_TABLE[item]
+
+
+################################################################################
+
+def priorities(items: bytes) -> bytes:
+    """
+    The puzzles collect the shared item type of every rucksack (or group) and
+    look up all of their priorities at once.
+
+    :param items: item types
+    :return: priority of every item type, all looked up in one translate() call
     """
 
-    if letter.islower():
-        return ord(letter) - 96
-    elif letter.isupper():
-        return ord(letter) - 38
-    else:
-        return -1
+    return items.translate(PRIORITY_TABLE)
 
 
 ################################################################################
@@ -146,9 +179,9 @@ def puzzle_01() -> None:
     :return: None; Answer should be 8088.
     """
 
-    print_puzzle_solution(sum(priority(
-        "".join(set(compartment[0]).intersection(set(compartment[1]))))
-                              for compartment in load_compartments()))
+    print_puzzle_solution(sum(priorities(bytes(
+        set(compartment[0]).intersection(compartment[1]).pop()
+        for compartment in load_compartments()))))
 
 
 ################################################################################
@@ -201,8 +234,8 @@ def puzzle_02() -> None:
     :return: None; Answer should be 2522.
     """
 
-    print_puzzle_solution(sum(priority(
-        "".join(set(group[0]) & set(group[1]) & set(group[2])))
-                              for group in load_groups()))
+    print_puzzle_solution(sum(priorities(bytes(
+        set(group[0]).intersection(group[1], group[2]).pop()
+        for group in load_groups()))))
 
 ################################################################################
@@ -0,0 +1,71 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+import numpy as np
+from typing import Tuple
+from src.day_04.puzzle import INPUT_FILE_PATH
+
+# turns "2-4,6-8" into "2 4 6 8"
+SEPARATORS_TO_SPACES = bytes.maketrans(b",-", b"  ")
+
+
+################################################################################
+
+def section_assignments_arrays() \
+        -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Loads all section assignment pairs at once as four arrays of range
+    endpoints (both inclusive). The whole input is parsed in a single
+    np.fromstring() call once the separators are turned into spaces.
+
+    :return: first and last sections of the first Elves' assignments, first
+    and last sections of the second Elves' assignments
+    """
+
+    with open(INPUT_FILE_PATH, "rb") as f:
+        text = f.read().translate(SEPARATORS_TO_SPACES).decode()
+
+    first_start, first_end, second_start, second_end = np.fromstring(
+        text, dtype=np.int64, sep=" ").reshape(-1, 4).T
+    return first_start, first_end, second_start, second_end
+
+
+################################################################################
+
+def count_fully_contained(first_start: np.ndarray, first_end: np.ndarray,
+                          second_start: np.ndarray,
+                          second_end: np.ndarray) -> int:
+    """
+    Vectorized fully_contains() over all pairs at once.
+
+    :param first_start: first sections of the first Elves' assignments
+    :param first_end: last sections of the first Elves' assignments
+    :param second_start: first sections of the second Elves' assignments
+    :param second_end: last sections of the second Elves' assignments
+    :return: number of pairs where one range fully contains the other
+    """
+
+    return int(np.count_nonzero(
+        ((first_start <= second_start) & (second_end <= first_end))
+        | ((second_start <= first_start) & (first_end <= second_end))))
+
+
+################################################################################
+
+def count_overlapping(first_start: np.ndarray, first_end: np.ndarray,
+                      second_start: np.ndarray, second_end: np.ndarray) -> int:
+    """
+    Vectorized overlap() over all pairs at once.
+
+    :param first_start: first sections of the first Elves' assignments
+    :param first_end: last sections of the first Elves' assignments
+    :param second_start: first sections of the second Elves' assignments
+    :param second_end: last sections of the second Elves' assignments
+    :return: number of pairs where the ranges share at least one section
+    """
+
+    return int(np.count_nonzero(
+        (first_start <= second_end) & (second_start <= first_end)))
+
+
+################################################################################
@@ -0,0 +1,145 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+from bisect import bisect_right
+from typing import Iterable, Iterator, Tuple
+from src.day_04.interval_node import Interval, IntervalNode
+
+
+################################################################################
+
+class AssignmentIndex(object):
+    """
+    Index of all section assignments of all Elves. Every assignment is
+    identified by the index of its pair in the list and the index of the Elf in
+    the pair (0 or 1). Overlap queries combine a centered interval tree (for
+    assignments that start before the queried range and reach into it) with a
+    list of assignments sorted by their first section (for assignments that
+    start inside the queried range), so they take O(log n + k).
+    """
+
+################################################################################
+
+    def __init__(self, pairs: Iterable[Tuple[range, range]]):
+        """
+        Build the index.
+
+        :param pairs: pairs of range assignments, as returned by
+        section_assignments_pairs()
+        """
+
+        self._intervals = sorted(
+            ((assignment.start, assignment.stop - 1, (pair_index, elf_index))
+             for pair_index, pair in enumerate(pairs)
+             for elf_index, assignment in enumerate(pair)),
+            key=lambda interval: interval[0])
+        self._starts = [interval[0] for interval in self._intervals]
+        self._root = IntervalNode(self._intervals) if self._intervals else None
+
+################################################################################
+
+    def _containing(self, section: int) -> Iterator[Interval]:
+        """
+        Walk the interval tree from the root towards the section; only the
+        nodes on that path can hold intervals containing it.
+
+        :param section: section ID
+        :return: iterator of all intervals containing the section
+        """
+
+        node = self._root
+        while node is not None:
+            yield from node.containing(section)
+            if section < node.center:
+                node = node.left
+            elif section > node.center:
+                node = node.right
+            else:
+                break
+
+################################################################################
+
+    def overlapping(self, first_section: int,
+                    last_section: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        An assignment overlaps the sections first_section through last_section
+        either if it contains first_section, or if it starts after
+        first_section but not after last_section. The two cases never report the
+        same assignment twice.
+
+        :param first_section: first section of the queried range
+        :param last_section: last section of the queried range (inclusive)
+        :return: ids (pair index, Elf index) of the overlapping assignments
+        """
+
+        if last_section < first_section:
+            return ()
+
+        starting_inside = self._intervals[
+            bisect_right(self._starts, first_section):
+            bisect_right(self._starts, last_section)]
+        containing = self._containing(first_section)
+        return tuple(interval[2] for interval in containing) \
+            + tuple(interval[2] for interval in starting_inside)
+
+################################################################################
+
+    def max_coverage(self) -> Tuple[int, int]:
+        """
+        Sweeps over all assignment endpoints in order. Every assignment adds one
+        Elf at its first section and removes it right after its last section;
+        at the same section, removals go first.
+
+        :return: the highest number of Elves assigned to a single section and
+        the first section where it is reached; (0, 0) if there are no
+        assignments
+        """
+
+        events = sorted(
+            [(interval[0], 1) for interval in self._intervals]
+            + [(interval[1] + 1, -1) for interval in self._intervals])
+
+        coverage = 0
+        max_coverage = 0
+        max_section = 0
+        for section, change in events:
+            coverage += change
+            if coverage > max_coverage:
+                max_coverage = coverage
+                max_section = section
+
+        return max_coverage, max_section
+
+################################################################################
+
+    def coverage(self) -> Tuple[int, Tuple[range, ...]]:
+        """
+        Merges all assignments into disjoint blocks of sections in one sweep
+        over the assignments sorted by their first section; sections themselves
+        are never enumerated. Gaps are the sections between the blocks, i.e.
+        between the first and the last assigned section that nobody cleans.
+
+        :return: number of distinct sections assigned to at least one Elf and
+        the gaps (as ranges, like the assignments themselves)
+        """
+
+        covered = 0
+        gaps = []
+        block_start = None
+        block_end = None
+        for start, end, _ in self._intervals:
+            if block_end is None:
+                block_start, block_end = start, end
+            elif start > block_end + 1:
+                covered += block_end - block_start + 1
+                gaps.append(range(block_end + 1, start))
+                block_start, block_end = start, end
+            else:
+                block_end = max(block_end, end)
+
+        if block_end is not None:
+            covered += block_end - block_start + 1
+
+        return covered, tuple(gaps)
+
+################################################################################
@@ -0,0 +1,108 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+from statistics import median_low
+from typing import Iterator, List, Tuple, Union
+
+# first section, last section (both inclusive) and assignment id
+Interval = Tuple[int, int, Tuple[int, int]]
+
+
+################################################################################
+
+class IntervalNode(object):
+    """
+    Node of a centered interval tree. The node center is the median of all the
+    interval endpoints it was built from. Intervals containing the center are
+    kept in the node itself, intervals entirely to the left or to the right of
+    the center are passed down to the left or the right child node. Using the
+    median keeps the tree balanced, so it is O(log n) nodes deep.
+    """
+
+################################################################################
+
+    def __init__(self, intervals: List[Interval]):
+        """
+        Pick the center and split the intervals between this node and its
+        children. Child nodes are built recursively.
+
+        :param intervals: intervals to build the (sub)tree from; not empty
+        """
+
+        self._center = median_low(endpoint for interval in intervals
+                                  for endpoint in interval[:2])
+        left = []
+        right = []
+        centered = []
+        for interval in intervals:
+            if interval[1] < self._center:
+                left.append(interval)
+            elif interval[0] > self._center:
+                right.append(interval)
+            else:
+                centered.append(interval)
+
+        # intervals containing the center, once by first section (ascending)
+        # and once by last section (descending); a query that stops being
+        # satisfied can stop scanning right away
+        self._by_start = sorted(centered, key=lambda interval: interval[0])
+        self._by_end = sorted(centered, key=lambda interval: interval[1],
+                              reverse=True)
+        self._left = IntervalNode(left) if left else None
+        self._right = IntervalNode(right) if right else None
+
+################################################################################
+
+    @property
+    def center(self) -> int:
+        """
+        :return: section that all intervals in this node contain
+        """
+
+        return self._center
+
+################################################################################
+
+    @property
+    def left(self) -> Union["IntervalNode", None]:
+        """
+        :return: subtree of intervals entirely to the left of the center
+        """
+
+        return self._left
+
+################################################################################
+
+    @property
+    def right(self) -> Union["IntervalNode", None]:
+        """
+        :return: subtree of intervals entirely to the right of the center
+        """
+
+        return self._right
+
+################################################################################
+
+    def containing(self, section: int) -> Iterator[Interval]:
+        """
+        Intervals of this node only, not of its children. Only intervals that
+        are reported are scanned (plus one), so this takes O(1 + k).
+
+        :param section: section ID
+        :return: iterator of the intervals in this node that contain the section
+        """
+
+        if section < self._center:
+            for interval in self._by_start:
+                if interval[0] > section:
+                    break
+                yield interval
+        elif section > self._center:
+            for interval in self._by_end:
+                if interval[1] < section:
+                    break
+                yield interval
+        else:
+            yield from self._by_start
+
+################################################################################
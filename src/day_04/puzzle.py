@@ -10,7 +10,6 @@ of the camp. Every section has a unique ID number, and each Elf is assigned a
 range of section IDs.
 """
 
-from re import compile
 from typing import Generator, Tuple
 from src.utils.utils import print_puzzle_solution
 
@@ -28,12 +27,39 @@ def section_assignments_pairs() -> Generator[Tuple[range, range], None, None]:
     """
 
     with open(INPUT_FILE_PATH, "r") as f:
-        pattern = compile(r"(\d+)")
-        return ((range(int(pattern.findall(line)[0]),
-                       int(pattern.findall(line)[1]) + 1),
-                 range(int(pattern.findall(line)[2]),
-                       int(pattern.findall(line)[3]) + 1))
-                for line in f.readlines())
+        # "2-4,6-8" -> (2, 4, 6, 8) with a single split
+        bounds = (tuple(map(int, line.replace(",", "-").split("-")))
+                  for line in f.read().split())
+        return ((range(bound[0], bound[1] + 1), range(bound[2], bound[3] + 1))
+                for bound in bounds)
+
+
+################################################################################
+
+def fully_contains(ranges: Tuple[range, range]) -> bool:
+    """
+    Both this and overlap() compare range endpoints only, so they take the
+    same time no matter how many sections the ranges span.
+
+    :param ranges: pair of range assignments
+    :return: True if one range fully contains the other, False otherwise
+    """
+
+    first, second = ranges
+    return (first.start <= second.start and second.stop <= first.stop) \
+        or (second.start <= first.start and first.stop <= second.stop)
+
+
+################################################################################
+
+def overlap(ranges: Tuple[range, range]) -> bool:
+    """
+    :param ranges: pair of range assignments
+    :return: True if the ranges share at least one section, False otherwise
+    """
+
+    first, second = ranges
+    return first.start < second.stop and second.start < first.stop
 
 
 ################################################################################
@@ -98,10 +124,8 @@ def puzzle_01() -> None:
     :return: None; Answer should be 562.
     """
 
-    print_puzzle_solution(len(tuple(filter(
-        lambda ranges: len(set(ranges[0]) - set(ranges[1])) == 0
-                       or len(set(ranges[1]) - set(ranges[0])) == 0,
-        section_assignments_pairs()))))
+    print_puzzle_solution(sum(
+        fully_contains(ranges) for ranges in section_assignments_pairs()))
 
 
 ################################################################################
@@ -127,8 +151,7 @@ def puzzle_02() -> None:
     :return: None; Answer should be 924.
     """
 
-    print_puzzle_solution(len(tuple(filter(
-        lambda ranges: len(set(ranges[0]) & set(ranges[1])) > 0,
-        section_assignments_pairs()))))
+    print_puzzle_solution(sum(
+        overlap(ranges) for ranges in section_assignments_pairs()))
 
 ################################################################################
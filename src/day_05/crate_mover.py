@@ -1,7 +1,15 @@
 __author__ = "Jakub Franěk"
 __email__ = "tofugangsw@gmail.com"
 
+from abc import abstractmethod
+from array import array
+from functools import cache
 from re import compile
+from typing import Iterator, Tuple
+from src.day_05.crate_rope import CrateRope
+
+# width of a crate in the drawing, including the space between crates
+CRATE_WIDTH = 4
 
 
 ################################################################################
@@ -9,47 +17,257 @@ from re import compile
 class CrateMover(object):
     """
     Superclass for CrateMover9000 and CrateMover9001. It loads the input file
-    and allows access to the string made of top crate of each stack.
+    and allows access to the string made of top crate of each stack. The input
+    file is parsed only once per process; every instance (of any crane model)
+    then shares the same starting stacks and instructions.
     """
 
+    # True if moved crates keep their order (CrateMover 9001), False if they
+    # end up reversed (CrateMover 9000, moving crates one at a time)
+    KEEPS_ORDER = None
+
     INPUT_FILE_PATH = "src/day_05/input.txt"
 
 ################################################################################
 
     def __init__(self):
         """
-        Processes the input file and creates the starting stacks of crates and
-        saves instructions for the cargo crane.
+        Creates the starting stacks of crates and gets instructions for the
+        cargo crane.
+        """
+
+        self._starting_stacks, self._instructions = self._load_input(
+            self.INPUT_FILE_PATH)
+        # stacks after every checkpoint_interval-th instruction; the starting
+        # stacks are the only checkpoint until record_checkpoints() is called
+        self._checkpoints = [self._starting_stacks]
+        self._checkpoint_interval = None
+        self.reset()
+
+################################################################################
+
+    @staticmethod
+    @cache
+    def _load_input(file_path: str) -> Tuple[Tuple[str, ...], array]:
+        """
+        Processes the input file. Instructions are compiled to a flat array of
+        integers; every instruction is a triple of the number of crates to move
+        and indexes of the stacks to move them from and to.
+
+        :param file_path: input file path
+        :return: starting stacks of crates (bottom crate first) and instructions
+        for the cargo crane
+        """
+
+        with open(file_path, "r") as f:
+            drawing, procedure = f.read().split("\n\n", 1)
+
+        # the last line of the drawing has column labels; every column is four
+        # characters wide ("[Z] ") and its crate names are at the second one
+        rows = drawing.split("\n")
+        stacks_count = len(rows.pop().split())
+        width = stacks_count * CRATE_WIDTH
+
+        # cut or pad the rows to the same width (trailing spaces must not
+        # shift the rows after them) and join them bottom row first; a stack
+        # is then a single stepped slice of that matrix, bottom crate first,
+        # with empty places above the top crate
+        matrix = "".join(row[:width].ljust(width) for row in reversed(rows))
+        stacks = tuple(matrix[column * CRATE_WIDTH + 1::width].rstrip()
+                       for column in range(stacks_count))
+
+        # finally, compile the procedure; those are the instructions for the
+        # CrateMover cargo crane ("move 1 from 2 to 1" becomes 1, 1, 0 as
+        # stacks are indexed from zero); crates are always moved between two
+        # different stacks that are in the drawing
+        numbers = map(int, compile(r"(\d+)").findall(procedure))
+        instructions = array("l")
+        for crate_count, stack_from, stack_to in zip(numbers, numbers, numbers):
+            if not (1 <= stack_from <= stacks_count
+                    and 1 <= stack_to <= stacks_count):
+                raise ValueError(
+                    "Cannot move crates from stack {} to stack {}; stacks "
+                    "are numbered 1-{}".format(
+                        stack_from, stack_to, stacks_count))
+            if stack_from == stack_to:
+                raise ValueError(
+                    "Cannot move crates from stack {} to itself".format(
+                        stack_from))
+            instructions.extend((crate_count, stack_from - 1, stack_to - 1))
+
+        return stacks, instructions
+
+################################################################################
+
+    @property
+    def instructions(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        :return: iterator of instructions; the number of crates to move, index
+        of the stack to move them from and index of the stack to move them to
+        """
+
+        numbers = iter(self._instructions)
+        return zip(numbers, numbers, numbers)
+
+################################################################################
+
+    def reset(self) -> None:
+        """
+        Puts all crates back to the starting stacks, so the instructions can be
+        followed again.
+        """
+
+        self._restore(self._starting_stacks)
+
+################################################################################
+
+    def _restore(self, stacks: Tuple[str, ...]) -> None:
+        """
+        :param stacks: stacks of crates to set (bottom crate first)
+        """
+
+        self._stacks = [list(stack) for stack in stacks]
+
+################################################################################
+
+    def _snapshot(self) -> Tuple[str, ...]:
+        """
+        :return: current stacks of crates (bottom crate first)
+        """
+
+        return tuple("".join(stack) for stack in self._stacks)
+
+################################################################################
+
+    def follow_instructions(self) -> None:
+        """
+        Follows all instructions for the cargo crane.
+        """
+
+        for crate_count, stack_from, stack_to in self.instructions:
+            self._move(crate_count, stack_from, stack_to)
+
+################################################################################
+
+    @staticmethod
+    def follow_instructions_together(crate_movers: Tuple["CrateMover", ...]) \
+            -> None:
+        """
+        Follows all instructions with several cranes in a single pass; each
+        instruction is decoded once and applied to the stacks of every crane.
+        The cranes must have been loaded from the same input file.
+
+        :param crate_movers: cranes to follow the instructions with
+        """
+
+        moves = tuple(crate_mover._move for crate_mover in crate_movers)
+        for crate_count, stack_from, stack_to in crate_movers[0].instructions:
+            for move in moves:
+                move(crate_count, stack_from, stack_to)
+
+################################################################################
+
+    def record_checkpoints(self, interval: int) -> None:
+        """
+        Follows all instructions from the starting stacks (like reset() and
+        follow_instructions()) and saves the stacks after every interval-th
+        instruction. Both memory used by the checkpoints and the time of a
+        stacks_after() query are then bounded by the interval.
+
+        :param interval: number of instructions between two checkpoints
+        """
+
+        if interval < 1:
+            raise ValueError(
+                "interval must be a positive integer, got {}".format(interval))
+
+        self.reset()
+        self._checkpoint_interval = interval
+        self._checkpoints = [self._starting_stacks]
+        for i, (crate_count, stack_from, stack_to) in enumerate(
+                self.instructions, 1):
+            self._move(crate_count, stack_from, stack_to)
+            if i % interval == 0:
+                self._checkpoints.append(self._snapshot())
+
+################################################################################
+
+    def stacks_after(self, instruction_count: int) -> Tuple[str, ...]:
+        """
+        Restores the nearest checkpoint before the given instruction and
+        follows the instructions from there. The current state of the stacks is
+        kept.
+
+        :param instruction_count: number of instructions followed; 0 means the
+        starting stacks
+        :return: stacks of crates after that many instructions (bottom crate
+        first)
+        """
+
+        if not 0 <= instruction_count <= len(self._instructions) // 3:
+            raise IndexError("instruction count out of range")
+
+        if self._checkpoint_interval is None:
+            checkpoint_index = 0
+        else:
+            checkpoint_index = min(
+                instruction_count // self._checkpoint_interval,
+                len(self._checkpoints) - 1)
+
+        stacks = self._stacks
+        self._restore(self._checkpoints[checkpoint_index])
+        instructions = self._instructions
+        for i in range(3 * checkpoint_index * (self._checkpoint_interval or 0),
+                       3 * instruction_count, 3):
+            self._move(instructions[i], instructions[i + 1],
+                       instructions[i + 2])
+        snapshot = self._snapshot()
+        self._stacks = stacks
+
+        return snapshot
+
+################################################################################
+
+    def stack_after(self, stack: int, instruction_count: int) -> str:
+        """
+        :param stack: index of the stack
+        :param instruction_count: number of instructions followed
+        :return: the stack of crates after that many instructions (bottom crate
+        first)
         """
 
-        with open(self.INPUT_FILE_PATH, "r") as f:
-            lines = f.readlines()
-            # find the line with column labels
-            labels_line_index = tuple(filter(
-                lambda i: all(char.isdecimal() or char.isspace()
-                              for char in lines[i].strip()),
-                range(len(lines))))[0]
+        return self.stacks_after(instruction_count)[stack]
+
+################################################################################
+
+    @abstractmethod
+    def _move(self, crate_count: int, stack_from: int, stack_to: int) -> None:
+        """
+        Moves crates from one stack to another, the way the crane model does.
+
+        :param crate_count: number of crates to move
+        :param stack_from: index of the stack to move the crates from
+        :param stack_to: index of the stack to move the crates to
+        """
+
+        ...
+
+################################################################################
 
-            # get index of every column; crate names are also at these indexes
-            pattern = compile(r"(\d+)")
-            labels = pattern.findall(lines[labels_line_index])
-            columns = (lines[labels_line_index].index(label)
-                       for label in labels)
+    def _split_index(self, crate_count: int, stack_from: int) -> int:
+        """
+        :param crate_count: number of crates to move
+        :param stack_from: index of the stack to move the crates from
+        :return: index of the lowest crate to move in the stack
+        """
 
-            # get crate names and arrange them to stacks
-            self._stacks = []
-            for column in columns:
-                self._stacks.append([])
-                for line_index in reversed(range(labels_line_index)):
-                    char = lines[line_index][column]
-                    if char.isalpha():
-                        self._stacks[-1].append(char)
-                    else:
-                        break
+        height = len(self._stacks[stack_from])
+        if not 0 <= crate_count <= height:
+            raise ValueError(
+                "Cannot move {} crates from stack {} with {} crates".format(
+                    crate_count, stack_from + 1, height))
 
-            # finally, load the rest of the input file; those are the
-            # instructions for the CrateMover cargo crane
-            self._instructions = lines[labels_line_index + 2:]
+        return height - crate_count
 
 ################################################################################
 
@@ -64,6 +282,49 @@ class CrateMover(object):
 
         return "".join(self._stacks[i][-1] for i in range(len(self._stacks)))
 
+################################################################################
+
+    def trace_top_crates(self) -> str:
+        """
+        Finds the top crates the instructions would end up with, without moving
+        any crates. Only stack heights are followed forward; then the final top
+        position of every stack is traced backward through the instructions to
+        the position it came from in the starting stacks. That takes
+        O(stacks * instructions) time and O(stacks) memory, no matter how tall
+        the stacks are. The current state of the stacks is not used or changed.
+
+        :return: string made of top crate in each stack; stacks that end up
+        empty are left out
+        """
+
+        heights = [len(stack) for stack in self._starting_stacks]
+        for crate_count, stack_from, stack_to in self.instructions:
+            heights[stack_from] -= crate_count
+            heights[stack_to] += crate_count
+
+        # (stack index, position from the bottom) of every final top crate
+        positions = [(stack, height - 1)
+                     for stack, height in enumerate(heights) if height > 0]
+
+        instructions = self._instructions
+        for i in range(len(instructions) - 3, -1, -3):
+            crate_count = instructions[i]
+            stack_from = instructions[i + 1]
+            stack_to = instructions[i + 2]
+            # heights are still the ones after this instruction
+            moved_from = heights[stack_to] - crate_count
+            for j, (stack, index) in enumerate(positions):
+                if stack == stack_to and index >= moved_from:
+                    offset = index - moved_from
+                    if not self.KEEPS_ORDER:
+                        offset = crate_count - 1 - offset
+                    positions[j] = (stack_from, heights[stack_from] + offset)
+            heights[stack_from] += crate_count
+            heights[stack_to] -= crate_count
+
+        return "".join(self._starting_stacks[stack][index]
+                       for stack, index in positions)
+
 ################################################################################
 
 
@@ -74,26 +335,29 @@ class CrateMover9000(CrateMover):
     Used in puzzle 1.
     """
 
+    KEEPS_ORDER = False
+
 ################################################################################
 
-    def follow_instructions(self) -> None:
+    def _move(self, crate_count: int, stack_from: int, stack_to: int) -> None:
         """
         In each step of the procedure, a quantity of crates is moved from one
         stack to a different stack. Crates are moved one at a time, so the first
-        crate to be moved ends up below the following crates.
-        """
+        crate to be moved ends up below the following crates. That is the same
+        as moving all of them at once in reversed order, which is done with a
+        single slice transfer instead of popping the crates one by one.
 
-        pattern = compile(r"(\d+)")
-
-        for instruction in self._instructions:
-            numbers = pattern.findall(instruction)
-            crate_count = int(numbers[0])
-            stack_from = int(numbers[1]) - 1
-            stack_to = int(numbers[2]) - 1
+        :param crate_count: number of crates to move
+        :param stack_from: index of the stack to move the crates from
+        :param stack_to: index of the stack to move the crates to
+        """
 
-            for _ in range(crate_count):
-                crate = self._stacks[stack_from].pop()
-                self._stacks[stack_to].append(crate)
+        source = self._stacks[stack_from]
+        split_index = self._split_index(crate_count, stack_from)
+        crates_to_move = source[split_index:]
+        crates_to_move.reverse()
+        self._stacks[stack_to] += crates_to_move
+        del source[split_index:]
 
 ################################################################################
 
@@ -107,24 +371,101 @@ class CrateMover9001(CrateMover):
     and move multiple crates at once. Used in puzzle 2.
     """
 
+    KEEPS_ORDER = True
+
 ################################################################################
 
-    def follow_instructions(self) -> None:
+    def _move(self, crate_count: int, stack_from: int, stack_to: int) -> None:
         """
         In each step of the procedure, a quantity of crates is moved from one
-        stack to a different stack. Moved crates stay in the same order.
+        stack to a different stack. Moved crates stay in the same order. Both
+        stacks are changed in place, so a move only costs the number of crates
+        moved, not the height of the stacks.
+
+        :param crate_count: number of crates to move
+        :param stack_from: index of the stack to move the crates from
+        :param stack_to: index of the stack to move the crates to
+        """
+
+        source = self._stacks[stack_from]
+        split_index = self._split_index(crate_count, stack_from)
+        self._stacks[stack_to] += source[split_index:]
+        del source[split_index:]
+
+################################################################################
+
+
+################################################################################
+
+class RopeCrateMover(CrateMover):
+    """
+    Superclass for RopeCrateMover9000 and RopeCrateMover9001. Stacks are kept
+    as CrateRope instances instead of lists, so a move takes O(log n) time no
+    matter how many crates are moved. Meant for huge synthetic inputs; on
+    regular ones, the list-based crane models are faster.
+    """
+
+################################################################################
+
+    def _restore(self, stacks: Tuple[str, ...]) -> None:
+        """
+        :param stacks: stacks of crates to set (bottom crate first)
         """
 
-        pattern = compile(r"(\d+)")
+        self._stacks = [CrateRope(stack) for stack in stacks]
+
+################################################################################
+
+
+################################################################################
+
+class RopeCrateMover9000(RopeCrateMover):
+    """
+    CrateMover 9000 with rope-backed stacks.
+    """
+
+    KEEPS_ORDER = False
+
+################################################################################
+
+    def _move(self, crate_count: int, stack_from: int, stack_to: int) -> None:
+        """
+        Crates are moved one at a time, so the moved crates end up in reversed
+        order.
 
-        for instruction in self._instructions:
-            numbers = pattern.findall(instruction)
-            crate_count = int(numbers[0])
-            stack_from = int(numbers[1]) - 1
-            stack_to = int(numbers[2]) - 1
+        :param crate_count: number of crates to move
+        :param stack_from: index of the stack to move the crates from
+        :param stack_to: index of the stack to move the crates to
+        """
+
+        crates_to_move = self._stacks[stack_from].split_top(crate_count)
+        crates_to_move.reverse()
+        self._stacks[stack_to].push(crates_to_move)
+
+################################################################################
+
+
+################################################################################
+
+class RopeCrateMover9001(RopeCrateMover):
+    """
+    CrateMover 9001 with rope-backed stacks.
+    """
+
+    KEEPS_ORDER = True
+
+################################################################################
+
+    def _move(self, crate_count: int, stack_from: int, stack_to: int) -> None:
+        """
+        Moved crates stay in the same order.
+
+        :param crate_count: number of crates to move
+        :param stack_from: index of the stack to move the crates from
+        :param stack_to: index of the stack to move the crates to
+        """
 
-            crates_to_move = self._stacks[stack_from][-crate_count:]
-            self._stacks[stack_from] = self._stacks[stack_from][:-crate_count]
-            self._stacks[stack_to] += crates_to_move
+        self._stacks[stack_to].push(
+            self._stacks[stack_from].split_top(crate_count))
 
 ################################################################################
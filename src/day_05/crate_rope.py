@@ -0,0 +1,270 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+from random import random
+from typing import Iterable, Iterator, Tuple, Union
+
+
+################################################################################
+
+class _RopeNode(object):
+    """
+    Node of an implicit treap. It holds one crate; its position in the stack is
+    given by the sizes of the subtrees, not stored anywhere. The reversed flag
+    means that the whole subtree is to be read in reversed order; it is pushed
+    down to the children only when the node is visited.
+    """
+
+    # attributes are accessed directly; properties are too slow here
+    __slots__ = ("crate", "priority", "size", "left", "right", "reversed")
+
+################################################################################
+
+    def __init__(self, crate: str):
+        """
+        :param crate: crate name
+        """
+
+        self.crate = crate
+        self.priority = random()
+        self.size = 1
+        self.left = None
+        self.right = None
+        self.reversed = False
+
+################################################################################
+
+    def push(self) -> None:
+        """
+        Applies pending reversal of this subtree: swaps the children and passes
+        the reversal down to them.
+        """
+
+        if self.reversed:
+            self.left, self.right = self.right, self.left
+            if self.left is not None:
+                self.left.reversed = not self.left.reversed
+            if self.right is not None:
+                self.right.reversed = not self.right.reversed
+            self.reversed = False
+
+################################################################################
+
+    def update(self) -> None:
+        """
+        Recounts the subtree size after its children have changed.
+        """
+
+        self.size = 1 + _size(self.left) + _size(self.right)
+
+################################################################################
+
+
+################################################################################
+
+def _size(node: Union[_RopeNode, None]) -> int:
+    """
+    :param node: subtree root or None for an empty subtree
+    :return: number of crates in the subtree
+    """
+
+    return node.size if node is not None else 0
+
+
+################################################################################
+
+def _split(node: Union[_RopeNode, None], count: int) \
+        -> Tuple[Union[_RopeNode, None], Union[_RopeNode, None]]:
+    """
+    :param node: subtree root
+    :param count: number of crates to split off the bottom of the subtree
+    :return: roots of the bottom count crates and of the rest of the subtree
+    """
+
+    if node is None:
+        return None, None
+
+    node.push()
+    if _size(node.left) >= count:
+        bottom, node.left = _split(node.left, count)
+        node.update()
+        return bottom, node
+    else:
+        node.right, top = _split(node.right, count - _size(node.left) - 1)
+        node.update()
+        return node, top
+
+
+################################################################################
+
+def _merge(bottom: Union[_RopeNode, None],
+           top: Union[_RopeNode, None]) -> Union[_RopeNode, None]:
+    """
+    :param bottom: root of the subtree to go below
+    :param top: root of the subtree to go on top
+    :return: root of the concatenated subtree
+    """
+
+    if bottom is None:
+        return top
+    if top is None:
+        return bottom
+
+    if bottom.priority > top.priority:
+        bottom.push()
+        bottom.right = _merge(bottom.right, top)
+        bottom.update()
+        return bottom
+    else:
+        top.push()
+        top.left = _merge(bottom, top.left)
+        top.update()
+        return top
+
+
+################################################################################
+
+class CrateRope(object):
+    """
+    Stack of crates stored in an implicit treap (a balanced binary tree keyed
+    by position). Taking any number of crates off the top, reversing them and
+    putting them onto another stack all take O(log n) expected time, so moving
+    a million crates costs about as much as moving one.
+    """
+
+################################################################################
+
+    def __init__(self, crates: Iterable[str] = ()):
+        """
+        Builds the treap in linear time: nodes are appended one by one while
+        the rightmost path of the tree is kept on a stack (the usual Cartesian
+        tree construction).
+
+        :param crates: crate names, the bottom crate first
+        """
+
+        spine = []
+        for crate in crates:
+            node = _RopeNode(crate)
+            last = None
+            while spine and spine[-1].priority < node.priority:
+                last = spine.pop()
+                last.update()
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+
+        self._root = spine[0] if spine else None
+        while spine:
+            spine.pop().update()
+
+################################################################################
+
+    @classmethod
+    def _from_root(cls, root: Union[_RopeNode, None]) -> "CrateRope":
+        """
+        :param root: treap root
+        :return: stack of crates wrapping the given treap
+        """
+
+        rope = cls()
+        rope._root = root
+        return rope
+
+################################################################################
+
+    def __len__(self) -> int:
+        """
+        :return: number of crates in the stack
+        """
+
+        return _size(self._root)
+
+################################################################################
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Walks down from the root to the crate; O(log n).
+
+        :param index: position of the crate; 0 is the bottom, -1 the top
+        :return: crate name
+        """
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("crate index out of range")
+
+        node = self._root
+        while True:
+            node.push()
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.crate
+            else:
+                index -= left_size + 1
+                node = node.right
+
+################################################################################
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        :return: iterator of crate names, the bottom crate first
+        """
+
+        path = []
+        node = self._root
+        while path or node is not None:
+            if node is not None:
+                node.push()
+                path.append(node)
+                node = node.left
+            else:
+                node = path.pop()
+                yield node.crate
+                node = node.right
+
+################################################################################
+
+    def split_top(self, count: int) -> "CrateRope":
+        """
+        Takes crates off the top of the stack.
+
+        :param count: number of crates to take
+        :return: the taken crates as a new stack, in the same order
+        """
+
+        if not 0 <= count <= len(self):
+            raise ValueError("Cannot take {} crates from a stack of {}".format(
+                count, len(self)))
+
+        self._root, top = _split(self._root, len(self) - count)
+        return self._from_root(top)
+
+################################################################################
+
+    def push(self, crates: "CrateRope") -> None:
+        """
+        Puts crates on top of the stack. The other stack is emptied.
+
+        :param crates: stack of crates to put on top of this one
+        """
+
+        self._root = _merge(self._root, crates._root)
+        crates._root = None
+
+################################################################################
+
+    def reverse(self) -> None:
+        """
+        Turns the stack upside down. Only marks the root; the reversal is
+        applied lazily, as parts of the stack get visited.
+        """
+
+        if self._root is not None:
+            self._root.reversed = not self._root.reversed
+
+################################################################################
@@ -15,12 +15,31 @@ rearrange them in a series of carefully-planned steps. After the crates are
 rearranged, the desired crates will be at the top of each stack.
 """
 
-from src.day_05.crate_mover import CrateMover9000, CrateMover9001
+from functools import cache
+from typing import Tuple
+from src.day_05.crate_mover import CrateMover, CrateMover9000, CrateMover9001
 from src.utils.utils import print_puzzle_solution
 
 INPUT_FILE_PATH = "src/day_05/input.txt"
 
 
+################################################################################
+
+@cache
+def top_crates() -> Tuple[str, str]:
+    """
+    Rearranges the crates with a CrateMover 9000 and a CrateMover 9001 side by
+    side; every instruction is decoded once and carried out by both cranes.
+
+    :return: top crates after the rearrangement procedure for puzzle 1
+    (CrateMover 9000) and puzzle 2 (CrateMover 9001)
+    """
+
+    crate_movers = (CrateMover9000(), CrateMover9001())
+    CrateMover.follow_instructions_together(crate_movers)
+    return crate_movers[0].top_crates, crate_movers[1].top_crates
+
+
 ################################################################################
 
 def puzzle_01() -> None:
@@ -94,9 +113,7 @@ def puzzle_01() -> None:
     :return: None; Answer should be TLNGFGMFN.
     """
 
-    crate_mover = CrateMover9000()
-    crate_mover.follow_instructions()
-    print_puzzle_solution(crate_mover.top_crates)
+    print_puzzle_solution(top_crates()[0])
 
 
 ################################################################################
@@ -167,8 +184,6 @@ def puzzle_02() -> None:
     :return: None; Answer should be FGLQJCMBD.
     """
 
-    crate_mover = CrateMover9001()
-    crate_mover.follow_instructions()
-    print_puzzle_solution(crate_mover.top_crates)
+    print_puzzle_solution(top_crates()[1])
 
 ################################################################################
@@ -18,6 +18,8 @@ you their one malfunctioning device - surely you'll have no problem fixing it.
 As if inspired by comedic timing, the device emits a few colorful sparks.
 """
 
+from functools import cache
+from typing import Tuple
 from src.utils.utils import print_puzzle_solution
 
 INPUT_FILE_PATH = "src/day_06/input.txt"
@@ -53,9 +55,76 @@ def marker_end_index(signal: str, marker_length: int) -> int:
     :return: the index of the last character of the marker
     """
 
-    return next(filter(
-        lambda i: len(set(list(signal[i - marker_length:i]))) == marker_length,
-        range(marker_length, len(signal))))
+    return marker_end_indexes(signal, (marker_length,))[0]
+
+
+################################################################################
+
+def marker_end_indexes(signal: str,
+                       marker_lengths: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Finds markers of several lengths in a single pass over the signal.
+
+    The signal is scanned once with a sliding window of distinct characters.
+    A table holds the index where each character was last seen; when the new
+    character was last seen inside the window, the window start jumps right
+    past it. A marker of any length not longer than the window ends at the
+    current character, so every marker is found as soon as the window first
+    grows long enough. That is O(len(signal)) for any number of marker
+    lengths, with no allocations per position. The signal has to be ASCII, so
+    that its bytes are its characters.
+
+    :param signal: elves' signal
+    :param marker_lengths: marker lengths
+    :return: the index of the last character of the marker, for each marker
+    length
+    """
+
+    for marker_length in marker_lengths:
+        if marker_length < 1:
+            raise ValueError(
+                "marker length must be a positive integer, got {}".format(
+                    marker_length))
+    if not signal.isascii():
+        raise ValueError("The signal must be ASCII")
+
+    # marker lengths not found yet, the longest first
+    pending = sorted(set(marker_lengths), reverse=True)
+    end_indexes = {}
+
+    last_seen = [-1] * 128
+    window_start = 0
+    for i, char in enumerate(signal.encode("ascii")):
+        if last_seen[char] >= window_start:
+            window_start = last_seen[char] + 1
+        last_seen[char] = i
+        while pending and i - window_start + 1 >= pending[-1]:
+            end_indexes[pending.pop()] = i + 1
+        if not pending:
+            break
+
+    if pending:
+        raise ValueError("No marker of length {} in the signal".format(
+            ", ".join(str(marker_length) for marker_length in pending)))
+
+    return tuple(end_indexes[marker_length] for marker_length in marker_lengths)
+
+
+################################################################################
+
+@cache
+def marker_end_indexes_of_input() -> Tuple[int, int]:
+    """
+    Scans the input file signal once for both the start-of-packet and the
+    start-of-message marker; puzzle_01() and puzzle_02() each report one of the
+    two indexes.
+
+    :return: the index of the last character of the start-of-packet marker and
+    of the start-of-message marker
+    """
+
+    return marker_end_indexes(load_signal(), (START_OF_PACKET_MARKER_LENGTH,
+                                              START_OF_MESSAGE_MARKER_LENGTH))
 
 
 ################################################################################
@@ -106,9 +175,7 @@ def puzzle_01() -> None:
     :return: None; Answer should be 1544.
     """
 
-    signal = load_signal()
-    print_puzzle_solution(
-        marker_end_index(signal, START_OF_PACKET_MARKER_LENGTH))
+    print_puzzle_solution(marker_end_indexes_of_input()[0])
 
 
 ################################################################################
@@ -136,8 +203,6 @@ def puzzle_02() -> None:
     :return: None; Answer should be 2145.
     """
 
-    signal = load_signal()
-    print_puzzle_solution(
-        marker_end_index(signal, START_OF_MESSAGE_MARKER_LENGTH))
+    print_puzzle_solution(marker_end_indexes_of_input()[1])
 
 ################################################################################